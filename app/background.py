@@ -2,15 +2,37 @@
 
 import asyncio
 import logging
+import threading
 from typing import Set
 from datetime import datetime
 
-from .ris_client import RISClient
+import msgspec
+
+from .ris_client import ActiveCallsResult, RISClient
 from .phone_poller import PhonePoller
 from .models import ClusterStatus
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of WebSocket clients sent to per event loop iteration
+BROADCAST_BATCH_SIZE = 50
+
+# Rebroadcast an unchanged status every N polls so clients still see a
+# fresh timestamp
+HEARTBEAT_EVERY_POLLS = 6
+
+# Send a full snapshot instead of a delta every N broadcasts so clients
+# resynchronise even if they missed a message
+SNAPSHOT_EVERY_BROADCASTS = 12
+
+# Seconds to wait for an in-flight RIS poll to finish when stopping
+RIS_THREAD_JOIN_TIMEOUT = 30
+
+
+def _encode(data: dict) -> bytes:
+    """Encode a message as compact UTF-8 JSON."""
+    return msgspec.json.encode(data)
+
 
 class BackgroundPoller:
     """Background task that polls CUCM RIS service and broadcasts updates."""
@@ -26,9 +48,20 @@ class BackgroundPoller:
         self.ris_client = RISClient()
         self.phone_poller = PhonePoller()
         self.current_status: ClusterStatus | None = None
+        self._last_dump: dict | None = None
+        self._last_payload: bytes | None = None
+        self._broadcasts_since_snapshot = 0
+        self._last_key: int | None = None
+        self._unchanged_polls = 0
         self.running = False
         self.task: asyncio.Task | None = None
-        self.phone_task: asyncio.Task | None = None
+        self._status_queue: asyncio.Queue | None = None
+        self._phone_task: asyncio.Task | None = None
+        self._phone_event = asyncio.Event()
+        self._latest_result: ActiveCallsResult | None = None
+        self._publish_lock = asyncio.Lock()
+        self._ris_thread: threading.Thread | None = None
+        self._ris_stop = threading.Event()
         self.websocket_clients: Set = set()
 
     async def start(self):
@@ -40,85 +73,246 @@ class BackgroundPoller:
         logger.info(f"Starting background poller (interval: {self.poll_interval}s)")
         self.running = True
 
+        # A worker from a previous run must not share the client with the new one
+        await self._join_ris_thread()
+
         # Connect to CUCM
         await asyncio.to_thread(self.ris_client.connect)
-
-        # Start polling loops
+        await self.phone_poller.start()
+
+        # Poll RIS on a dedicated thread; each run gets its own queue and stop
+        # flag so a thread still finishing a query after stop() can't leak
+        # results into the next run. The queue holds a single result so a
+        # slow broadcast only ever catches up with the latest poll.
+        self._status_queue = asyncio.Queue(maxsize=1)
+        self._ris_stop = threading.Event()
+        self._ris_thread = threading.Thread(
+            target=self._ris_worker,
+            args=(asyncio.get_running_loop(), self._status_queue, self._ris_stop),
+            name="ris-poller",
+            daemon=True,
+        )
+        self._ris_thread.start()
+
+        # Start polling loop, and the phone worker it hands each result to
+        self._phone_event = asyncio.Event()
+        self._latest_result = None
         self.task = asyncio.create_task(self._poll_loop())
-        self.phone_task = asyncio.create_task(self._phone_poll_loop())
+        self._phone_task = asyncio.create_task(self._phone_loop())
 
     async def stop(self):
         """Stop the background polling task."""
         logger.info("Stopping background poller")
         self.running = False
+        self._ris_stop.set()
+
+        for task in (self.task, self._phone_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+
+        await self.phone_poller.stop()
+
+        # Let an in-flight poll finish so it can't reopen a PerfMon session
+        # after close()
+        await self._join_ris_thread()
+        await asyncio.to_thread(self.ris_client.close)
+
+    async def _join_ris_thread(self):
+        """Wait (bounded) for the RIS worker thread to exit."""
+        thread = self._ris_thread
+        if thread is None or not thread.is_alive():
+            return
 
-        if self.task:
-            self.task.cancel()
+        await asyncio.to_thread(thread.join, RIS_THREAD_JOIN_TIMEOUT)
+        if thread.is_alive():
+            logger.warning(
+                f"RIS poller thread still running after {RIS_THREAD_JOIN_TIMEOUT}s"
+            )
+
+    def _ris_worker(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        queue: asyncio.Queue,
+        stop: threading.Event,
+    ):
+        """
+        Poll the RIS service on a dedicated thread until stopped.
+
+        Args:
+            loop: Event loop that consumes the results.
+            queue: Queue that receives each poll result (None on failure).
+            stop: Event set when polling should stop.
+        """
+        while not stop.is_set():
+            logger.debug("Polling CUCM RIS service...")
             try:
-                await self.task
-            except asyncio.CancelledError:
-                pass
+                result = self.ris_client.get_active_calls()
+            except Exception as e:
+                logger.error(f"Error polling CUCM RIS service: {e}")
+                result = None
 
-        if self.phone_task:
-            self.phone_task.cancel()
             try:
-                await self.phone_task
-            except asyncio.CancelledError:
-                pass
+                loop.call_soon_threadsafe(self._put_latest, queue, result)
+            except RuntimeError:
+                # Event loop closed during shutdown
+                break
+
+            # Wait for next poll interval
+            stop.wait(self.poll_interval)
+
+    @staticmethod
+    def _put_latest(queue: asyncio.Queue, result: ActiveCallsResult | None):
+        """
+        Queue a poll result, replacing any result that hasn't been handled yet.
+
+        Args:
+            queue: Single-slot result queue.
+            result: Poll result (None on failure).
+        """
+        if queue.full():
+            queue.get_nowait()
+            logger.debug("Previous RIS result still pending, replacing it with the latest")
+        queue.put_nowait(result)
 
     async def _poll_loop(self):
-        """Main polling loop."""
+        """Main polling loop, handling results from the RIS worker thread."""
         while self.running:
+            result = await self._status_queue.get()
             try:
-                # Poll RIS service
-                logger.debug("Polling CUCM RIS service...")
-                status = await asyncio.to_thread(self.ris_client.get_active_calls)
-
-                if status:
-                    # Merge phone call status into device status
-                    for device in status.devices:
-                        if device.ip_address:
-                            device.call_status = self.phone_poller.get_call_status(device.ip_address)
-                        else:
-                            device.call_status = "Unknown"
-
-                    self.current_status = status
-                    # Broadcast to all connected WebSocket clients
-                    await self._broadcast_update(status)
+                if result:
+                    # Publish the RIS data straight away with the call status
+                    # from the last phone pass, so it never waits on phones
+                    self._merge_call_status(result)
+                    self.current_status = result.status
+                    self._latest_result = result
+                    await self._publish(result.status)
+
+                    # Have the phone worker refresh call status for this result
+                    self._phone_event.set()
                 else:
                     logger.warning("Failed to get status from CUCM")
 
             except Exception as e:
                 logger.error(f"Error in polling loop: {e}")
 
-            # Wait for next poll interval
-            await asyncio.sleep(self.poll_interval)
+    async def _phone_loop(self):
+        """
+        Poll phones for the latest RIS result, one pass at a time.
 
-    async def _phone_poll_loop(self):
-        """Phone polling loop - runs every 5 seconds."""
+        Passes never overlap; results that arrive during a pass are coalesced
+        and the next pass polls the newest one's phones.
+        """
         while self.running:
+            await self._phone_event.wait()
+            self._phone_event.clear()
             try:
-                # Get current device list with IP addresses
-                if self.current_status and self.current_status.devices:
-                    ip_addresses = [
-                        device.ip_address
-                        for device in self.current_status.devices
-                        if device.ip_address
-                    ]
-
-                    if ip_addresses:
-                        logger.debug(f"Polling {len(ip_addresses)} phones for call status...")
-                        await self.phone_poller.poll_all_phones(ip_addresses)
-                    else:
-                        logger.debug("No phone IP addresses available for polling")
-                else:
-                    logger.debug("No device status available yet for phone polling")
+                ip_addresses = self._latest_result.ip_addresses
+                if not ip_addresses:
+                    continue
+
+                logger.debug(f"Polling {len(ip_addresses)} phones for call status...")
+                await self.phone_poller.poll_all_phones(ip_addresses)
+
+                # Merge into whichever result is current now, which may be
+                # newer than the one this pass started from
+                result = self._latest_result
+                self._merge_call_status(result)
+                await self._publish(result.status, count_poll=False)
 
             except Exception as e:
-                logger.error(f"Error in phone polling loop: {e}")
+                logger.error(f"Error polling phones: {e}")
+
+    def _merge_call_status(self, result: ActiveCallsResult):
+        """Copy cached phone call status onto a result's devices."""
+        call_status_cache = self.phone_poller.call_status_cache
+        for device, ip_address in zip(result.ip_devices, result.ip_addresses):
+            device.call_status = call_status_cache.get(ip_address, "Unknown")
+
+    async def _publish(self, status: ClusterStatus, count_poll: bool = True):
+        """
+        Broadcast a status to all connected WebSocket clients, skipping it if
+        nothing but the timestamp changed.
+
+        Args:
+            status: Cluster status to broadcast.
+            count_poll: Whether this is a new RIS poll, which counts towards
+                the heartbeat rebroadcast of an unchanged status.
+        """
+        # RIS results and phone passes both publish; keep their deltas ordered
+        async with self._publish_lock:
+            key = self._status_key(status)
+            if key != self._last_key or (
+                count_poll and self._unchanged_polls >= HEARTBEAT_EVERY_POLLS
+            ):
+                self._last_key = key
+                self._unchanged_polls = 0
+                await self._broadcast_update(status)
+            else:
+                if count_poll:
+                    self._unchanged_polls += 1
+                logger.debug("Status unchanged, skipping broadcast")
+
+    @staticmethod
+    def _status_key(status: ClusterStatus) -> int:
+        """
+        Hash the parts of a status that clients display, ignoring the timestamp.
 
-            # Wait 5 seconds before next poll
-            await asyncio.sleep(5)
+        Args:
+            status: Cluster status to hash.
+
+        Returns:
+            int: Hash that changes whenever a broadcast would show something new.
+        """
+        return hash((
+            status.cucm_host,
+            status.total_devices,
+            status.registered_devices,
+            status.total_active_calls,
+            tuple(
+                (d.name, d.ip_address, d.status, d.active_calls,
+                 d.description, d.model, d.call_status)
+                for d in status.devices
+            ),
+            tuple((n.name, n.status, n.is_healthy) for n in status.nodes),
+        ))
+
+    @staticmethod
+    def _make_delta(previous: dict, current: dict) -> dict | None:
+        """
+        Build a delta message between two serialized statuses.
+
+        The delta carries every top-level field except ``devices`` in full,
+        plus ``changed_devices`` as ``[index, device]`` pairs for the devices
+        that differ from the previous status.
+
+        Args:
+            previous: Previously broadcast status.
+            current: Status to broadcast.
+
+        Returns:
+            dict | None: Delta message, or None if the device list changed
+            shape and a full snapshot is needed.
+        """
+        previous_devices = previous["devices"]
+        current_devices = current["devices"]
+        if len(previous_devices) != len(current_devices) or any(
+            old["name"] != new["name"]
+            for old, new in zip(previous_devices, current_devices)
+        ):
+            return None
+
+        delta = {key: value for key, value in current.items() if key != "devices"}
+        delta["type"] = "delta"
+        delta["changed_devices"] = [
+            [index, new]
+            for index, (old, new) in enumerate(zip(previous_devices, current_devices))
+            if old != new
+        ]
+        return delta
 
     async def _broadcast_update(self, status: ClusterStatus):
         """
@@ -127,24 +321,70 @@ class BackgroundPoller:
         Args:
             status: Current cluster status to broadcast.
         """
+        dump = msgspec.to_builtins(status)
+        previous = self._last_dump
+        self._last_dump = dump
+        self._last_payload = None
+
         if not self.websocket_clients:
             return
 
-        # Prepare message
-        message = status.model_dump_json()
+        # Clients hold the previous broadcast, so usually only the devices
+        # that changed need to be sent; fall back to a full snapshot
+        # periodically or when the device list itself changed
+        delta = None
+        if previous is not None and self._broadcasts_since_snapshot < SNAPSHOT_EVERY_BROADCASTS:
+            delta = self._make_delta(previous, dump)
+
+        # Encode once; every client is sent the same bytes
+        if delta is None:
+            payload = self.get_current_payload()
+            self._broadcasts_since_snapshot = 0
+        else:
+            payload = _encode(delta)
+            self._broadcasts_since_snapshot += 1
+
+        # Send to all connected clients concurrently so a slow client
+        # doesn't hold up the others (snapshot, the set may change meanwhile)
+        clients = list(self.websocket_clients)
+        if len(clients) <= BROADCAST_BATCH_SIZE:
+            results = await self._send_batch(clients, payload)
+        else:
+            # Large audiences go out in batches, yielding to the event loop
+            # in between so HTTP/WebSocket handlers aren't starved
+            results = []
+            for start in range(0, len(clients), BROADCAST_BATCH_SIZE):
+                if start:
+                    await asyncio.sleep(0)
+                batch = clients[start:start + BROADCAST_BATCH_SIZE]
+                results.extend(await self._send_batch(batch, payload))
 
-        # Send to all connected clients
         disconnected_clients = set()
-        for websocket in self.websocket_clients:
-            try:
-                await websocket.send_text(message)
-            except Exception as e:
-                logger.debug(f"Failed to send to client: {e}")
+        for websocket, result in zip(clients, results):
+            if isinstance(result, Exception):
+                logger.debug(f"Failed to send to client: {result}")
                 disconnected_clients.add(websocket)
 
         # Remove disconnected clients
         self.websocket_clients -= disconnected_clients
 
+    @staticmethod
+    async def _send_batch(clients: list, payload: bytes) -> list:
+        """
+        Send a payload to a group of WebSocket clients concurrently.
+
+        Args:
+            clients: WebSocket clients to send to.
+            payload: Encoded message.
+
+        Returns:
+            list: Per-client result, an Exception for failed sends.
+        """
+        return await asyncio.gather(
+            *(websocket.send_bytes(payload) for websocket in clients),
+            return_exceptions=True,
+        )
+
     def add_websocket_client(self, websocket):
         """Add a WebSocket client to receive updates."""
         self.websocket_clients.add(websocket)
@@ -159,6 +399,12 @@ class BackgroundPoller:
         """Get the most recent status."""
         return self.current_status
 
+    def get_current_payload(self) -> bytes | None:
+        """Get the most recently broadcast status as an encoded full snapshot."""
+        if self._last_payload is None and self._last_dump is not None:
+            self._last_payload = _encode(self._last_dump)
+        return self._last_payload
+
     def get_connection_status(self) -> dict:
         """Get connection status."""
         return self.ris_client.get_connection_status()
@@ -15,6 +15,11 @@ class Settings(BaseSettings):
 
     # Application Settings
     poll_interval: int = Field(default=5, env="POLL_INTERVAL")
+    perfmon_cache_ttl: float = Field(default=10, env="PERFMON_CACHE_TTL")
+    # Devices per selectCmDevice call; RIS allows at most 1000, and every
+    # extra page counts against its ~15 requests/minute limit
+    ris_page_size: int = Field(default=1000, ge=1, le=1000, env="RIS_PAGE_SIZE")
+    device_prefixes: str = Field(default="SEP", env="DEVICE_PREFIXES")  # Comma-separated
     log_level: str = Field(default="INFO", env="LOG_LEVEL")
     host: str = Field(default="0.0.0.0", env="HOST")
     port: int = Field(default=8000, env="PORT")
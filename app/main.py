@@ -3,7 +3,7 @@
 import logging
 from pathlib import Path
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
 
@@ -11,6 +11,7 @@ from .config import settings
 from .background import BackgroundPoller
 from .models import ConnectionStatus
 from pydantic import BaseModel
+import msgspec
 import os
 
 # Configure logging
@@ -33,6 +34,69 @@ class CUCMSettings(BaseModel):
 # Initialize background poller
 poller = BackgroundPoller(poll_interval=settings.poll_interval)
 
+# .env file updated by the settings page, cached in memory as its lines in
+# file order plus the line index of each key (None if there is no file)
+ENV_PATH = Path("/app/.env")
+_env_lines: list[str] | None = None
+_env_index: dict[str, int] = {}
+
+
+def _load_env_file():
+    """Load the .env file into the in-memory cache."""
+    global _env_lines
+
+    _env_index.clear()
+    if not ENV_PATH.exists():
+        _env_lines = None
+        return
+
+    _env_lines = ENV_PATH.read_text().splitlines(keepends=True)
+    for index, line in enumerate(_env_lines):
+        _env_index[line.split("=")[0].strip()] = index
+
+
+def _update_env_file(values: dict[str, str]) -> bool:
+    """
+    Update or add settings in the .env file, writing only if something changed.
+
+    Args:
+        values: Mapping of environment variable name to value.
+
+    Returns:
+        bool: True if the file was rewritten.
+    """
+    if _env_lines is None:
+        return False
+
+    changed = False
+    for key, value in values.items():
+        line = f"{key}={value}\n"
+        index = _env_index.get(key)
+        if index is None:
+            if _env_lines and not _env_lines[-1].endswith("\n"):
+                _env_lines[-1] += "\n"
+            _env_index[key] = len(_env_lines)
+            _env_lines.append(line)
+            changed = True
+        elif _env_lines[index] != line:
+            _env_lines[index] = line
+            changed = True
+
+    if not changed:
+        return False
+
+    # Write a temporary file and swap it in so the .env is never half-written
+    content = "".join(_env_lines)
+    tmp_path = ENV_PATH.with_name(".env.tmp")
+    try:
+        tmp_path.write_text(content)
+        os.replace(tmp_path, ENV_PATH)
+    except OSError:
+        # e.g. the .env is a bind-mounted file, which can't be replaced
+        tmp_path.unlink(missing_ok=True)
+        ENV_PATH.write_text(content)
+    return True
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -44,6 +108,7 @@ async def lifespan(app: FastAPI):
     """
     # Startup
     logger.info("Starting CUCM Live Monitor...")
+    _load_env_file()
     logger.info(f"Connecting to CUCM: {settings.cucm_host}")
     await poller.start()
 
@@ -66,6 +131,10 @@ app = FastAPI(
 static_dir = Path(__file__).parent.parent / "static"
 app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
 
+# Pages are static, so read them once instead of on every request
+_INDEX_HTML = (static_dir / "index.html").read_bytes()
+_SETTINGS_HTML = (static_dir / "settings.html").read_bytes()
+
 
 @app.get("/", response_class=HTMLResponse)
 async def get_dashboard():
@@ -75,9 +144,7 @@ async def get_dashboard():
     Returns:
         HTMLResponse: Dashboard HTML content.
     """
-    html_file = static_dir / "index.html"
-    with open(html_file, "r") as f:
-        return HTMLResponse(content=f.read())
+    return HTMLResponse(content=_INDEX_HTML)
 
 
 @app.get("/settings", response_class=HTMLResponse)
@@ -88,9 +155,7 @@ async def get_settings_page():
     Returns:
         HTMLResponse: Settings page HTML content.
     """
-    html_file = static_dir / "settings.html"
-    with open(html_file, "r") as f:
-        return HTMLResponse(content=f.read())
+    return HTMLResponse(content=_SETTINGS_HTML)
 
 
 @app.get("/health")
@@ -115,7 +180,7 @@ async def get_status():
     status = poller.get_current_status()
 
     if status:
-        return JSONResponse(content=status.model_dump(mode='json'))
+        return Response(content=msgspec.json.encode(status), media_type="application/json")
     else:
         connection_status = poller.get_connection_status()
         return JSONResponse(
@@ -179,37 +244,12 @@ async def update_settings(new_settings: CUCMSettings):
         settings.poll_interval = new_settings.poll_interval
 
         # Update .env file for persistence
-        env_path = Path("/app/.env")
-        if env_path.exists():
-            with open(env_path, "r") as f:
-                lines = f.readlines()
-
-            # Update or add settings
-            settings_map = {
-                "CUCM_HOST": new_settings.cucm_host,
-                "CUCM_USERNAME": new_settings.cucm_username,
-                "CUCM_PASSWORD": new_settings.cucm_password,
-                "POLL_INTERVAL": str(new_settings.poll_interval),
-            }
-
-            updated_lines = []
-            updated_keys = set()
-
-            for line in lines:
-                key = line.split("=")[0].strip()
-                if key in settings_map:
-                    updated_lines.append(f"{key}={settings_map[key]}\n")
-                    updated_keys.add(key)
-                else:
-                    updated_lines.append(line)
-
-            # Add any missing keys
-            for key, value in settings_map.items():
-                if key not in updated_keys:
-                    updated_lines.append(f"{key}={value}\n")
-
-            with open(env_path, "w") as f:
-                f.writelines(updated_lines)
+        _update_env_file({
+            "CUCM_HOST": new_settings.cucm_host,
+            "CUCM_USERNAME": new_settings.cucm_username,
+            "CUCM_PASSWORD": new_settings.cucm_password,
+            "POLL_INTERVAL": str(new_settings.poll_interval),
+        })
 
         # Restart poller with new settings
         await poller.stop()
@@ -250,9 +290,9 @@ async def websocket_endpoint(websocket: WebSocket):
 
     try:
         # Send initial status if available
-        current_status = poller.get_current_status()
-        if current_status:
-            await websocket.send_text(current_status.model_dump_json())
+        payload = poller.get_current_payload()
+        if payload:
+            await websocket.send_bytes(payload)
 
         # Keep connection alive and handle incoming messages
         while True:
@@ -264,9 +304,9 @@ async def websocket_endpoint(websocket: WebSocket):
             if data == "ping":
                 await websocket.send_text("pong")
             elif data == "status":
-                status = poller.get_current_status()
-                if status:
-                    await websocket.send_text(status.model_dump_json())
+                payload = poller.get_current_payload()
+                if payload:
+                    await websocket.send_bytes(payload)
 
     except WebSocketDisconnect:
         logger.info("WebSocket client disconnected")
@@ -278,6 +318,7 @@ async def websocket_endpoint(websocket: WebSocket):
 
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
 
     uvicorn.run(
@@ -286,4 +327,6 @@ if __name__ == "__main__":
         port=settings.port,
         reload=True,
         log_level=settings.log_level.lower(),
+        # uvloop isn't available on Windows
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
     )
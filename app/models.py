@@ -1,11 +1,15 @@
 """Data models for CUCM Live Monitor."""
 
-from pydantic import BaseModel
+import msgspec
 from typing import List, Optional
 from datetime import datetime
 
+# Device and node structs only hold scalars and are created by the thousand
+# each poll, so they opt out of GC tracking (gc=False): they can never be
+# part of a reference cycle, and skipping the GC header saves memory.
 
-class DeviceStatus(BaseModel):
+
+class DeviceStatus(msgspec.Struct, kw_only=True, gc=False):
     """Device status information."""
     name: str
     ip_address: Optional[str] = None
@@ -16,14 +20,14 @@ class DeviceStatus(BaseModel):
     call_status: Optional[str] = None  # "On Call", "Idle", "Unknown"
 
 
-class NodeStatus(BaseModel):
+class NodeStatus(msgspec.Struct, kw_only=True, gc=False):
     """CUCM node status information."""
     name: str
     status: str  # "Ok", "NotFound", "Unknown"
     is_healthy: bool
 
 
-class ClusterStatus(BaseModel):
+class ClusterStatus(msgspec.Struct, kw_only=True):
     """Overall cluster status."""
     total_devices: int
     registered_devices: int
@@ -34,7 +38,7 @@ class ClusterStatus(BaseModel):
     cucm_host: str
 
 
-class ConnectionStatus(BaseModel):
+class ConnectionStatus(msgspec.Struct, kw_only=True):
     """Connection status to CUCM."""
     connected: bool
     cucm_host: str
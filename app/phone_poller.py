@@ -8,47 +8,70 @@ import aiohttp
 
 logger = logging.getLogger(__name__)
 
+# Stream status markers on the phone's streaming statistics page,
+# e.g. <b>Active</b> or <b> Active</b> (with space)
+_ACTIVE_RE = re.compile(rb'<b>\s*Active\s*</b>', re.IGNORECASE)
+_NOT_READY_RE = re.compile(rb'<b>\s*Not ready\s*</b>', re.IGNORECASE)
+
+# Common exact spellings of the markers (lowercased), checked with a plain
+# substring search before falling back to the patterns above
+_ACTIVE_MARKERS = (b'<b>active</b>', b'<b> active</b>')
+_NOT_READY_MARKERS = (b'<b>not ready</b>', b'<b> not ready</b>')
+
+# Bytes of the previous chunk kept when searching a streamed body, so a
+# marker split across two chunks is still found
+_MARKER_OVERLAP = max(len(marker) for marker in _ACTIVE_MARKERS + _NOT_READY_MARKERS) - 1
+
+# Size of the chunks the response body is read in
+_READ_CHUNK_SIZE = 2048
+
 
 class PhonePoller:
     """Polls individual phone web interfaces to check call status."""
 
-    def __init__(self):
-        """Initialize phone poller."""
+    def __init__(self, max_concurrent: int = 64):
+        """
+        Initialize phone poller.
+
+        Args:
+            max_concurrent: Maximum number of phone requests in flight at once.
+        """
         self.call_status_cache: Dict[str, str] = {}  # {ip_address: "On Call" | "Idle" | "Unknown"}
-        self.running = False
-        self.task: Optional[asyncio.Task] = None
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._session: Optional[aiohttp.ClientSession] = None
 
     async def start(self):
-        """Start the phone polling task."""
-        if self.running:
-            logger.warning("Phone poller already running")
-            return
-
-        logger.info("Starting phone polling task (interval: 5s)")
-        self.running = True
-        self.task = asyncio.create_task(self._poll_loop())
+        """Open the HTTP session used for phone requests."""
+        self._get_session()
 
     async def stop(self):
-        """Stop the phone polling task."""
-        logger.info("Stopping phone poller")
-        self.running = False
-
-        if self.task:
-            self.task.cancel()
-            try:
-                await self.task
-            except asyncio.CancelledError:
-                pass
-
-    async def _poll_loop(self):
-        """Main polling loop - runs every 60 seconds."""
-        while self.running:
-            try:
-                # Poll phones will be triggered externally with the device list
-                await asyncio.sleep(60)
-            except Exception as e:
-                logger.error(f"Error in phone polling loop: {e}")
-                await asyncio.sleep(60)
+        """Close the HTTP session used for phone requests."""
+        if self._session:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared HTTP session, creating it if needed.
+
+        A single pooled session keeps connections to phones alive between
+        polls instead of opening a new connector per request.
+
+        Returns:
+            aiohttp.ClientSession: Shared session for phone requests.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=256,
+                limit_per_host=1,
+                ttl_dns_cache=300,
+                keepalive_timeout=30,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=5),
+            )
+        return self._session
 
     async def poll_phone(self, ip_address: str) -> str:
         """
@@ -66,12 +89,22 @@ class PhonePoller:
         url = f"http://{ip_address}/CGI/Java/Serviceability?adapter=device.statistics.streaming.0"
 
         try:
-            timeout = aiohttp.ClientTimeout(total=5)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(url) as response:
+            async with self._semaphore:
+                async with self._get_session().get(url) as response:
                     if response.status == 200:
-                        html = await response.text()
-                        return self._parse_stream_status(html)
+                        # Stop downloading as soon as a status marker shows up
+                        html = bytearray()
+                        tail = b""
+                        async for chunk in response.content.iter_chunked(_READ_CHUNK_SIZE):
+                            html += chunk
+                            window = tail + chunk.lower()
+                            stream_status = self._find_stream_marker(window)
+                            if stream_status:
+                                response.close()
+                                return stream_status
+                            tail = window[-_MARKER_OVERLAP:]
+
+                        return self._parse_stream_status(bytes(html))
                     else:
                         logger.debug(f"Phone {ip_address} returned status {response.status}")
                         return "Unknown"
@@ -86,28 +119,48 @@ class PhonePoller:
             logger.debug(f"Error polling phone {ip_address}: {e}")
             return "Unknown"
 
-    def _parse_stream_status(self, html: str) -> str:
+    @staticmethod
+    def _find_stream_marker(lowered: bytes) -> Optional[str]:
+        """
+        Look for the literal stream status markers.
+
+        Args:
+            lowered: Lowercased HTML (or part of it) from phone.
+
+        Returns:
+            Optional[str]: "On Call", "Idle", or None if no marker was found.
+        """
+        if any(marker in lowered for marker in _ACTIVE_MARKERS):
+            return "On Call"
+        if any(marker in lowered for marker in _NOT_READY_MARKERS):
+            return "Idle"
+        return None
+
+    def _parse_stream_status(self, html: bytes) -> str:
         """
         Parse HTML to extract stream status.
 
         Args:
-            html: HTML response from phone.
+            html: Raw HTML response body from phone.
 
         Returns:
             str: "On Call", "Idle", or "Unknown"
         """
-        # Look for <b>Active</b> or <b>Not ready</b> or <b> Active</b> (with space)
-        # Pattern: <b>Active</b> or <b> Active</b>
-        active_pattern = re.compile(r'<b>\s*Active\s*</b>', re.IGNORECASE)
-        not_ready_pattern = re.compile(r'<b>\s*Not ready\s*</b>', re.IGNORECASE)
+        # Fast path: literal marker search
+        stream_status = self._find_stream_marker(html.lower())
+        if stream_status:
+            return stream_status
 
-        if active_pattern.search(html):
+        # Slow path: tolerate unusual whitespace around the markers
+        if _ACTIVE_RE.search(html):
             return "On Call"
-        elif not_ready_pattern.search(html):
+        elif _NOT_READY_RE.search(html):
             return "Idle"
         else:
             # Log first 500 chars for debugging if we can't parse
-            logger.debug(f"Could not parse stream status. HTML snippet: {html[:500]}")
+            if logger.isEnabledFor(logging.DEBUG):
+                snippet = html[:500].decode("utf-8", errors="replace")
+                logger.debug(f"Could not parse stream status. HTML snippet: {snippet}")
             return "Unknown"
 
     async def poll_all_phones(self, ip_addresses: list[str]) -> Dict[str, str]:
@@ -143,15 +196,3 @@ class PhonePoller:
 
         logger.info(f"Phone polling complete: {len(call_status_map)} phones polled")
         return call_status_map
-
-    def get_call_status(self, ip_address: str) -> str:
-        """
-        Get cached call status for a phone.
-
-        Args:
-            ip_address: Phone IP address.
-
-        Returns:
-            str: "On Call", "Idle", or "Unknown"
-        """
-        return self.call_status_cache.get(ip_address, "Unknown")
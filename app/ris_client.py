@@ -1,14 +1,24 @@
 """RIS (Real-time Information Server) API client for CUCM."""
 
 import logging
-import subprocess
-from typing import List, Optional, Dict
+import os
+import socket
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, NamedTuple, Optional, Dict, Sequence
 from datetime import datetime
+from io import BytesIO
+import msgspec
 import requests
+from lxml import etree
 from zeep import Client, Settings, Transport
+from zeep.cache import SqliteCache
 from zeep.exceptions import Fault
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 from requests.packages.urllib3.exceptions import InsecureRequestWarning
+from urllib3.connection import HTTPConnection
 
 from .models import DeviceStatus, ClusterStatus, NodeStatus
 from .config import settings
@@ -18,6 +28,72 @@ requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent node health probes for large clusters
+MAX_PROBE_WORKERS = 16
+
+# Seconds a resolved node address is reused before DNS is asked again
+DNS_CACHE_TTL = 300
+
+# On-disk cache of the RIS/PerfMon WSDLs and their imported schemas, which
+# are static per CUCM version, so reconnecting doesn't download them again
+WSDL_CACHE_PATH = os.path.join(tempfile.gettempdir(), "cucm_wsdl.db")
+WSDL_CACHE_TIMEOUT = 86400  # seconds
+
+# DirNumber line statuses that mean the line has an active call
+_ACTIVE_CALL_STATUSES = frozenset({'Connected', 'CallInProgress', 'CallRemotelyHeld', 'CallConnected'})
+
+# CmDevice fields that might indicate call status, logged for the first
+# device of each node when debugging
+_CANDIDATE_FIELDS = (
+    'Status', 'DeviceStatus', 'LineStatus', 'StreamingStatus',
+    'CallStatus', 'ActiveCalls', 'State', 'Ready',
+)
+
+# Elements of the raw selectCmDevice response the streaming parser stops on.
+# Array entries are named CmNode/CmDevice or item depending on the RIS
+# schema, so nodes and devices are told apart by their parent element.
+_RIS_PARSE_TAGS = ("{*}CmNode", "{*}CmDevice", "{*}item", "{*}StateInfo", "{*}Fault")
+
+# Device name prefix queried when DEVICE_PREFIXES is empty
+DEFAULT_DEVICE_PREFIX = "SEP"
+
+# DeviceStatus fields parsed from RIS, in the struct's declaration order
+_PARSED_DEVICE_FIELDS = ("name", "ip_address", "status", "active_calls", "description", "model")
+
+# Most devices read in one poll before giving up on further RIS pages
+RIS_MAX_DEVICES = 10000
+
+# TCP keepalive probes on pooled CUCM connections, so firewalls and load
+# balancers don't drop them while idle between polls (seconds)
+TCP_KEEPALIVE_IDLE = 30
+TCP_KEEPALIVE_INTERVAL = 10
+
+# Cisco CallManager PerfMon counters collected per node by default
+DEFAULT_PERFMON_COUNTERS = ("CallsActive",)
+
+
+class ActiveCallsResult(NamedTuple):
+    """A RIS poll result and the phones whose call status should be polled."""
+
+    status: ClusterStatus
+    ip_devices: List[DeviceStatus]  # Devices that have an IP address
+    ip_addresses: List[str]  # Their IP addresses, in matching order
+
+
+class KeepAliveHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled sockets send TCP keepalive probes."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        socket_options = list(HTTPConnection.default_socket_options)
+        socket_options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        # Probe timing options aren't available on every platform
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            socket_options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, TCP_KEEPALIVE_IDLE))
+        if hasattr(socket, "TCP_KEEPINTVL"):
+            socket_options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, TCP_KEEPALIVE_INTERVAL))
+        kwargs["socket_options"] = socket_options
+        super().init_poolmanager(*args, **kwargs)
+
 
 class RISClient:
     """Client for CUCM RIS (Real-time Information Server) API."""
@@ -29,16 +105,53 @@ class RISClient:
         self.password = settings.cucm_password
         # Use RISService for CUCM 12.5+
         self.wsdl_url = f"https://{self.cucm_host}:8443/realtimeservice2/services/RISService?wsdl"
+        self.device_prefixes: List[str] = [DEFAULT_DEVICE_PREFIX]  # Parsed at connect
         self.client: Optional[Client] = None
+        self._ris_factory = None  # self.client.type_factory("ns0"), built at connect
+        self._client_host: Optional[str] = None  # Host self.client was built for
         self.connected = False
         self.last_error: Optional[str] = None
         self.last_successful_poll: Optional[datetime] = None
 
+        # HTTP session shared by the RIS and PerfMon clients so every SOAP
+        # call reuses pooled keep-alive TLS connections
+        self._session = requests.Session()
+        self._session.verify = False  # Disable SSL verification for self-signed certs
+        self._session.headers.update({"Connection": "keep-alive"})
+        self._session.mount(
+            "https://",
+            KeepAliveHTTPAdapter(pool_connections=4, pool_maxsize=16, pool_block=False),
+        )
+        self._wsdl_cache = SqliteCache(path=WSDL_CACHE_PATH, timeout=WSDL_CACHE_TIMEOUT)
+
         # PerfMon client for active calls
         self.perfmon_client: Optional[Client] = None
+        self._perfmon_factory = None  # self.perfmon_client.type_factory("ns0"), built at connect
+        self._perfmon_host: Optional[str] = None  # Host self.perfmon_client was built for
         self.perfmon_connected = False
         self.cucm_nodes = []  # Will be populated from RIS query
 
+        # PerfMon session kept open across polls and the (nodes, counters) it
+        # has counters added for
+        self._perfmon_session_handle = None
+        self._perfmon_session_key: tuple = ()
+
+        # Last PerfMon metrics, the (nodes, counters) they cover and when they expire
+        self._perfmon_cache: Optional[dict] = None
+        self._perfmon_cache_key: tuple = ()
+        self._perfmon_cache_expiry = 0.0
+
+        # PerfMon and node health checks run alongside the RIS query. PerfMon
+        # gets a single worker so its SOAP calls never overlap each other.
+        self._perfmon_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="perfmon")
+        self._health_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="health")
+
+        # Device models from the previous poll, keyed by (node, device name)
+        self._device_cache: Dict[tuple, DeviceStatus] = {}
+
+        # Resolved addresses for CUCM hostnames: host -> (address, expiry)
+        self._dns_cache: Dict[str, tuple] = {}
+
     def connect(self) -> bool:
         """
         Establish connection to CUCM RIS service.
@@ -49,22 +162,42 @@ class RISClient:
         try:
             logger.info(f"Connecting to CUCM RIS service at {self.cucm_host}...")
 
-            # Create session with authentication
-            session = requests.Session()
-            session.auth = HTTPBasicAuth(self.username, self.password)
-            session.verify = False  # Disable SSL verification for self-signed certs
+            # Authenticate the shared session (credentials may have changed)
+            self._session.auth = HTTPBasicAuth(self.username, self.password)
 
-            # Configure Zeep transport
-            transport = Transport(session=session, timeout=10)
-            zeep_settings = Settings(strict=False, xml_huge_tree=True)
+            # Reuse the existing SOAP client, with its parsed WSDL and type
+            # factories, unless the CUCM host changed
+            if self.client is None or self._client_host != self.cucm_host:
+                # Nodes, devices and metrics from another cluster don't apply
+                self.cucm_nodes = []
+                self._device_cache = {}
+                self._perfmon_cache = None
 
-            # Create SOAP client
-            self.client = Client(self.wsdl_url, transport=transport, settings=zeep_settings)
+                self.wsdl_url = f"https://{self.cucm_host}:8443/realtimeservice2/services/RISService?wsdl"
+
+                # Configure Zeep transport
+                transport = Transport(session=self._session, cache=self._wsdl_cache, timeout=10)
+                zeep_settings = Settings(strict=False, xml_huge_tree=True)
+
+                # Create SOAP client
+                self.client = Client(self.wsdl_url, transport=transport, settings=zeep_settings)
+
+                # Override the service endpoint to use the correct CUCM host
+                # (WSDL often contains localhost references)
+                service_endpoint = f"https://{self.cucm_host}:8443/realtimeservice2/services/RISService"
+                self.client.service._binding_options["address"] = service_endpoint
+                self._ris_factory = self.client.type_factory("ns0")
+                self._client_host = self.cucm_host
 
-            # Override the service endpoint to use the correct CUCM host
-            # (WSDL often contains localhost references)
-            service_endpoint = f"https://{self.cucm_host}:8443/realtimeservice2/services/RISService"
-            self.client.service._binding_options["address"] = service_endpoint
+            # Parse the device prefixes once rather than on every poll
+            self.device_prefixes = self._parse_device_prefixes(settings.device_prefixes)
+
+            # Resolve the CUCM host up front so a DNS problem shows up now
+            # and the address is cached for the node health probes
+            try:
+                self._resolve(self.cucm_host)
+            except OSError as e:
+                logger.warning(f"Could not resolve CUCM host {self.cucm_host}: {e}")
 
             # Skip test connection - will verify on first actual query
             # self._test_connection()
@@ -80,13 +213,40 @@ class RISClient:
             logger.error(f"Failed to connect to CUCM RIS service: {e}")
             return False
 
+    @staticmethod
+    def _parse_device_prefixes(value: str) -> List[str]:
+        """
+        Parse the comma-separated DEVICE_PREFIXES setting.
+
+        Trailing wildcards are dropped since one is added to each prefix in
+        the query ("SEP*" and "SEP" both mean "SEP*").
+
+        Args:
+            value: Setting value, e.g. "SEP,ATA"
+
+        Returns:
+            List[str]: Non-empty prefixes, or [DEFAULT_DEVICE_PREFIX] if none
+        """
+        prefixes = []
+        for prefix in value.split(","):
+            prefix = prefix.strip().rstrip("*")
+            if prefix and prefix not in prefixes:
+                prefixes.append(prefix)
+
+        if not prefixes:
+            logger.warning(
+                f"DEVICE_PREFIXES is empty, querying {DEFAULT_DEVICE_PREFIX}* devices"
+            )
+            prefixes = [DEFAULT_DEVICE_PREFIX]
+        return prefixes
+
     def _test_connection(self):
         """Test the RIS connection with a minimal query."""
         if not self.client:
             raise Exception("Client not initialized")
 
         # Create a minimal query to test connection
-        criteria_factory = self.client.type_factory("ns0")
+        criteria_factory = self._ris_factory
 
         # Create search criteria for devices
         # NodeName="": Empty string means all nodes
@@ -108,24 +268,25 @@ class RISClient:
             result = self.client.service.selectCmDevice(
                 StateInfo=state_info, CmSelectionCriteria=criteria
             )
-            logger.debug(f"Test connection successful: {result}")
+            logger.debug("Test connection successful: %s", result)
         except Fault as fault:
             logger.error(f"SOAP Fault during test: {fault}")
             logger.error(f"Fault code: {fault.code if hasattr(fault, 'code') else 'N/A'}")
             logger.error(f"Fault message: {fault.message if hasattr(fault, 'message') else 'N/A'}")
             # Try to extract detail text
             if hasattr(fault, 'detail'):
-                from lxml import etree
                 detail_text = etree.tostring(fault.detail, encoding='unicode', pretty_print=True)
                 logger.error(f"Fault detail XML:\n{detail_text}")
             raise
 
-    def get_active_calls(self) -> Optional[ClusterStatus]:
+    def get_active_calls(self) -> Optional[ActiveCallsResult]:
         """
         Get current active call status from all devices.
 
         Returns:
-            ClusterStatus: Current cluster status with device information.
+            ActiveCallsResult: Current cluster status with device information,
+                plus the devices with an IP address and those IPs, so phone
+                polling doesn't rescan all devices.
         """
         if not self.connected or not self.client:
             logger.warning("Not connected to CUCM. Attempting to connect...")
@@ -133,21 +294,28 @@ class RISClient:
                 return None
 
         try:
+            # PerfMon and node health only depend on the node list, so start
+            # them for the nodes seen last poll while the RIS query runs
+            known_nodes = list(self.cucm_nodes)
+            perfmon_future = health_future = None
+            if known_nodes:
+                perfmon_future = self._perfmon_executor.submit(self.get_perfmon_metrics)
+                health_future = self._health_executor.submit(self.check_node_health, known_nodes)
+
             logger.debug("Querying RIS for device status...")
 
-            criteria_factory = self.client.type_factory("ns0")
+            criteria_factory = self._ris_factory
 
             # Create search criteria - query all phone devices across ALL nodes
-            # Try querying for specific device first, then expand to all
+            # with one wildcard per configured name prefix (e.g. "SEP*")
             select_items = criteria_factory.ArrayOfSelectItem()
-            # Add specific device for testing
-            select_item1 = criteria_factory.SelectItem(Item="SEPA0334FCEAE1A")
-            # Add wildcard for all devices starting with SEP
-            select_item2 = criteria_factory.SelectItem(Item="SEP*")
-            select_items.item = [select_item1, select_item2]
+            select_items.item = [
+                criteria_factory.SelectItem(Item=f"{prefix}*")
+                for prefix in self.device_prefixes
+            ]
 
             criteria = criteria_factory.CmSelectionCriteria(
-                MaxReturnedDevices=1000,  # Adjust based on your environment
+                MaxReturnedDevices=settings.ris_page_size,
                 DeviceClass="Phone",
                 Model=255,  # Any model
                 Status="Any",
@@ -156,148 +324,135 @@ class RISClient:
                 SelectItems=select_items,
             )
 
-            state_info = ""
-
-            # Execute RIS query
-            result = self.client.service.selectCmDevice(
-                StateInfo=state_info, CmSelectionCriteria=criteria
-            )
-
-            # Debug: Log the raw result structure
-            logger.info(f"RIS Query Result: {result}")
-            if hasattr(result, "SelectCmDeviceResult"):
-                logger.info(f"SelectCmDeviceResult exists: {result.SelectCmDeviceResult}")
-                if result.SelectCmDeviceResult and hasattr(result.SelectCmDeviceResult, "CmNodes"):
-                    logger.info(f"CmNodes: {result.SelectCmDeviceResult.CmNodes}")
+            # Execute RIS query, one page at a time
+            cm_devices = self._select_cm_device_pages(criteria)
 
             # Parse the results
             devices = []
-            total_calls = 0
             registered_count = 0
             nodes = []
 
             # Extract CUCM node names for PerfMon queries
             node_names = []
-
-            if hasattr(result, "SelectCmDeviceResult") and result.SelectCmDeviceResult:
-                logger.debug("✅ SelectCmDeviceResult exists and is not None")
-                cm_nodes = result.SelectCmDeviceResult.CmNodes
-
-                # The actual list of nodes is in CmNodes.CmNode, not CmNodes itself
-                if hasattr(cm_nodes, 'CmNode') and cm_nodes.CmNode:
-                    cm_devices = cm_nodes.CmNode
-                    logger.debug(f"Found {len(cm_devices)} CUCM nodes")
-
-                    # Extract node hostnames and status for PerfMon and UI
-                    for node in cm_devices:
-                        if hasattr(node, 'Name') and node.Name:
-                            node_names.append(node.Name)
-
-                            # Extract node status (ReturnCode: Ok, NotFound, etc.)
-                            # Note: If the node appears in RIS response, it's up and running
-                            # "NotFound" just means no devices registered, not that node is down
-                            node_return_code = node.ReturnCode if hasattr(node, 'ReturnCode') else 'Unknown'
-                            is_healthy = True  # Node responded to RIS query = node is up
-
-                            nodes.append(NodeStatus(
-                                name=node.Name,
-                                status=node_return_code,
-                                is_healthy=is_healthy
-                            ))
-
-                            logger.debug(f"Found CUCM node: {node.Name} (Status: {node_return_code})")
-
-                    for idx, node in enumerate(cm_devices):
-                        logger.debug(f"Processing node {idx}: {node.Name if hasattr(node, 'Name') else 'Unknown'}")
-
-                        if hasattr(node, "CmDevices") and node.CmDevices:
-                            # Access the actual device list from CmDevices.CmDevice
-                            if hasattr(node.CmDevices, 'CmDevice') and node.CmDevices.CmDevice:
-                                devices_list = node.CmDevices.CmDevice
-                                logger.debug(f"✅ Node {idx} ({node.Name}) has {len(devices_list)} devices")
-                                for dev_idx, device in enumerate(devices_list):
-                                    # Debug: Log all available attributes for the first device to understand structure
-                                    if dev_idx == 0:
-                                        logger.info(f"Device attributes: {dir(device)}")
-                                        # Log specific fields that might indicate call status
-                                        for attr in ['Status', 'DeviceStatus', 'LineStatus', 'StreamingStatus',
-                                                     'CallStatus', 'ActiveCalls', 'State', 'Ready']:
-                                            if hasattr(device, attr):
-                                                logger.info(f"Device.{attr}: {getattr(device, attr)}")
-
-                                    # Extract device information
-                                    device_name = device.Name if hasattr(device, "Name") else "Unknown"
-                                    ip_address = (
-                                        device.IpAddress if hasattr(device, "IpAddress") else None
-                                    )
-                                    status_str = (
-                                        device.Status if hasattr(device, "Status") else "Unknown"
-                                    )
-                                    description = (
-                                        device.Description
-                                        if hasattr(device, "Description")
-                                        else None
-                                    )
-                                    model = str(device.Model) if hasattr(device, "Model") and device.Model else None
-
-                                    # Count active calls from DirNumber field
-                                    # DirNumber format: "1234-Registered" or "1234-Connected,5678-Registered"
-                                    active_calls = 0
-                                    if hasattr(device, "DirNumber") and device.DirNumber:
-                                        dir_numbers = str(device.DirNumber).split(',')
-                                        for dir_num in dir_numbers:
-                                            if '-' in dir_num:
-                                                status = dir_num.split('-')[-1].strip()
-                                                # Active call statuses: Connected, CallInProgress, CallRemotelyHeld, CallConnected
-                                                if status in ['Connected', 'CallInProgress', 'CallRemotelyHeld', 'CallConnected']:
-                                                    active_calls += 1
-
-                                    # Track registered devices
-                                    if "Registered" in status_str:
-                                        registered_count += 1
-
-                                    total_calls += active_calls
-
-                                    devices.append(
-                                        DeviceStatus(
-                                            name=device_name,
-                                            ip_address=ip_address,
-                                            status=status_str,
-                                            active_calls=active_calls,
-                                            description=description,
-                                            model=model,
-                                        )
-                                    )
-                        else:
-                            logger.debug(f"Node {idx} has no devices")
-                else:
-                    logger.debug("No CmNode found in CmNodes")
+            device_cache = {}
+
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+            # Devices that have an IP address, and those IPs in matching order
+            ip_devices = []
+            ip_addresses = []
+
+            if cm_devices:
+                logger.debug("Found %d CUCM nodes", len(cm_devices))
+
+                # Extract node hostnames and status for PerfMon and UI
+                for node in cm_devices:
+                    node_name = node.get('Name')
+                    if node_name:
+                        node_names.append(node_name)
+
+                        # Extract node status (ReturnCode: Ok, NotFound, etc.)
+                        # Note: If the node appears in RIS response, it's up and running
+                        # "NotFound" just means no devices registered, not that node is down
+                        node_return_code = node.get('ReturnCode', 'Unknown')
+                        is_healthy = True  # Node responded to RIS query = node is up
+
+                        nodes.append(NodeStatus(
+                            name=node_name,
+                            status=node_return_code,
+                            is_healthy=is_healthy
+                        ))
+
+                        logger.debug("Found CUCM node: %s (Status: %s)", node_name, node_return_code)
+
+                for idx, node in enumerate(cm_devices):
+                    node_name = node.get('Name', 'Unknown')
+                    logger.debug("Processing node %d: %s", idx, node_name)
+
+                    devices_list = node['CmDevices']
+                    if devices_list:
+                        logger.debug("✅ Node %d (%s) has %d devices", idx, node_name, len(devices_list))
+                        for dev_idx, device in enumerate(devices_list):
+                            # Debug: Log fields that might indicate call status for the first device
+                            # (only when DEBUG is on, so INFO runs skip it)
+                            if dev_idx == 0 and debug_enabled:
+                                logger.debug(
+                                    "Device fields: %s",
+                                    {f: device.get(f) for f in _CANDIDATE_FIELDS},
+                                )
+
+                            # Extract device information
+                            device_name = device.get("Name", "Unknown")
+                            ip_address = device.get("IpAddress")
+                            status_str = device.get("Status") or "Unknown"
+                            description = device.get("Description")
+                            model = device.get("Model") or None
+
+                            # Count active calls from DirNumber field
+                            # DirNumber format: "1234-Registered" or "1234-Connected,5678-Registered"
+                            active_calls = 0
+                            dir_number = device.get("DirNumber")
+                            if dir_number:
+                                dir_numbers = dir_number.split(',')
+                                for dir_num in dir_numbers:
+                                    parts = dir_num.rsplit('-', 1)
+                                    if len(parts) == 2 and parts[1].strip() in _ACTIVE_CALL_STATUSES:
+                                        active_calls += 1
+
+                            # Track registered devices
+                            if "Registered" in status_str:
+                                registered_count += 1
+
+                            cache_key = (node_name, device_name)
+                            device_status = self._cached_device_status(
+                                cache_key,
+                                (device_name, ip_address, status_str, active_calls, description, model),
+                            )
+                            device_cache[cache_key] = device_status
+                            devices.append(device_status)
+
+                            if ip_address:
+                                ip_devices.append(device_status)
+                                ip_addresses.append(ip_address)
+                            else:
+                                # Phones without an IP can't be polled
+                                device_status.call_status = "Unknown"
+                    else:
+                        logger.debug("Node %d has no devices", idx)
             else:
-                logger.debug("SelectCmDeviceResult not found or empty")
+                logger.debug("No CmNode found in RIS response")
 
             logger.info(f"Parsing complete: {len(devices)} devices parsed")
+            self._device_cache = device_cache
             self.last_successful_poll = datetime.now()
             self.last_error = None
 
             # Store CUCM nodes for PerfMon queries
             if node_names:
                 self.cucm_nodes = node_names
-                logger.debug(f"Stored {len(node_names)} CUCM nodes for PerfMon")
+                logger.debug("Stored %d CUCM nodes for PerfMon", len(node_names))
+
+            # Re-run PerfMon and health checks if the node list changed since
+            # the overlapped ones were started
+            if perfmon_future is None or self.cucm_nodes != known_nodes:
+                perfmon_future = self._perfmon_executor.submit(self.get_perfmon_metrics)
+            if health_future is None or node_names != known_nodes:
+                health_future = self._health_executor.submit(self.check_node_health, node_names)
 
-            # Get PerfMon metrics (active calls)
-            perfmon_data = self.get_perfmon_metrics()
+            # Get PerfMon metrics (active calls); PerfMon is the source of the cluster total
+            perfmon_data = perfmon_future.result()
             total_calls = perfmon_data['total_calls']
             node_metrics = perfmon_data['node_metrics']
 
-            # Check node health via ping
-            node_health_status = self.check_node_health_ping(node_names)
+            # Check node health via TCP probe
+            node_health_status = health_future.result()
 
             # Update node health
             for node in nodes:
-                # Update health based on ping response
+                # Update health based on probe response
                 if node.name in node_health_status:
                     node.is_healthy = node_health_status[node.name]
-                    logger.debug(f"Updated {node.name} health from ping: {node.is_healthy}")
+                    logger.debug("Updated %s health from probe: %s", node.name, node.is_healthy)
 
             cluster_status = ClusterStatus(
                 total_devices=len(devices),
@@ -314,7 +469,7 @@ class RISClient:
                 f"{registered_count} registered, {total_calls} active calls (from PerfMon)"
             )
 
-            return cluster_status
+            return ActiveCallsResult(cluster_status, ip_devices, ip_addresses)
 
         except Fault as fault:
             self.last_error = f"SOAP Fault: {fault.message if hasattr(fault, 'message') else str(fault)}"
@@ -329,6 +484,142 @@ class RISClient:
             self.connected = False
             return None
 
+    def _select_cm_device_pages(self, criteria) -> list:
+        """
+        Run selectCmDevice page by page until every device has been read.
+
+        Each page returns at most settings.ris_page_size devices; its
+        StateInfo is passed back to fetch the next one. A node is reported on
+        every page, so its devices from all pages are merged into one entry.
+
+        Args:
+            criteria: CmSelectionCriteria for the query.
+
+        Returns:
+            list: Parsed nodes, as returned by _parse_select_cm_device.
+        """
+        nodes_by_name: Dict[str, dict] = {}
+        state_info = ""
+        device_count = 0
+
+        while True:
+            # Zeep still builds the request, but the response is parsed
+            # straight from the XML instead of into Zeep objects, which
+            # dominates parse time for large clusters
+            with self.client.settings(raw_response=True):
+                response = self.client.service.selectCmDevice(
+                    StateInfo=state_info, CmSelectionCriteria=criteria
+                )
+            page_nodes, state_info = self._parse_select_cm_device(response)
+
+            page_count = 0
+            for node in page_nodes:
+                page_count += len(node["CmDevices"])
+                merged = nodes_by_name.get(node.get("Name"))
+                if merged is None:
+                    nodes_by_name[node.get("Name")] = node
+                else:
+                    merged["CmDevices"].extend(node["CmDevices"])
+            device_count += page_count
+
+            # A short page means there is nothing left to fetch
+            if page_count < settings.ris_page_size or not state_info:
+                break
+            if device_count >= RIS_MAX_DEVICES:
+                logger.warning(f"Stopped reading RIS pages at {device_count} devices")
+                break
+            logger.debug("Fetching next RIS page after %d devices", device_count)
+
+        return list(nodes_by_name.values())
+
+    @staticmethod
+    def _parse_select_cm_device(response: requests.Response) -> tuple:
+        """
+        Stream-parse a raw selectCmDevice SOAP response.
+
+        Only node and device elements are materialised, as plain dicts of
+        their direct children's text, and each is cleared once read so the
+        tree never holds more than the device being parsed.
+
+        Args:
+            response: HTTP response returned by Zeep with raw_response=True.
+
+        Returns:
+            tuple: (nodes, state_info) where nodes is a list of
+                {'Name': ..., 'ReturnCode': ..., 'CmDevices': [device dicts]}
+                and state_info is the RIS continuation token ("" if none).
+
+        Raises:
+            Fault: If the response is a SOAP fault.
+        """
+        # Errors that aren't SOAP faults may not even be XML
+        if not response.ok and "xml" not in response.headers.get("Content-Type", ""):
+            response.raise_for_status()
+
+        nodes = []
+        node_devices = []
+        state_info = ""
+
+        for _, elem in etree.iterparse(
+            BytesIO(response.content), events=("end",), tag=_RIS_PARSE_TAGS, huge_tree=True
+        ):
+            tag = elem.tag.rpartition("}")[2]
+            if tag == "StateInfo":
+                state_info = elem.text or ""
+            elif tag == "Fault":
+                raise Fault(
+                    message=elem.findtext("faultstring") or "Unknown SOAP fault",
+                    code=elem.findtext("faultcode"),
+                )
+            else:
+                container = elem.getparent().tag.rpartition("}")[2]
+                if container == "CmDevices":
+                    node_devices.append(
+                        {child.tag.rpartition("}")[2]: child.text for child in elem}
+                    )
+                elif container == "CmNodes":
+                    node = {child.tag.rpartition("}")[2]: child.text for child in elem}
+                    node["CmDevices"] = node_devices
+                    nodes.append(node)
+                    node_devices = []
+                else:
+                    # An item nested inside a device (e.g. line status); it
+                    # is part of that device's subtree, so leave it alone
+                    continue
+
+            # Drop the parsed element and the already-handled siblings before it
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+        response.raise_for_status()
+        return nodes, state_info
+
+    def _cached_device_status(self, cache_key: tuple, values: tuple) -> DeviceStatus:
+        """
+        Build a DeviceStatus, reusing the previous poll's model where possible.
+
+        Most devices don't change between polls, so the cached model is
+        returned as-is when its fields match and copied with the new
+        fields otherwise.
+
+        Args:
+            cache_key: (node name, device name) the device was reported under.
+            values: Field values parsed from the RIS response, ordered as
+                _PARSED_DEVICE_FIELDS.
+
+        Returns:
+            DeviceStatus: Model for the device.
+        """
+        cached = self._device_cache.get(cache_key)
+        if cached is None:
+            return DeviceStatus(**dict(zip(_PARSED_DEVICE_FIELDS, values)))
+
+        # One C-level tuple comparison instead of a getattr per field
+        if msgspec.structs.astuple(cached)[:len(values)] == values:
+            return cached
+        return msgspec.structs.replace(cached, **dict(zip(_PARSED_DEVICE_FIELDS, values)))
+
     def get_connection_status(self) -> dict:
         """
         Get current connection status.
@@ -352,21 +643,22 @@ class RISClient:
         Returns:
             bool: True if connection successful, False otherwise.
         """
-        if self.perfmon_connected and self.perfmon_client:
+        if self.perfmon_connected and self.perfmon_client and self._perfmon_host == self.cucm_host:
             return True
 
+        # A session on the previous host's client can't be reused
+        self._close_perfmon_session()
+
         try:
             logger.info("Connecting to CUCM PerfMon service...")
 
             perfmon_wsdl = f"https://{self.cucm_host}:8443/perfmonservice2/services/PerfmonService?wsdl"
 
-            # Create session with authentication
-            session = requests.Session()
-            session.auth = HTTPBasicAuth(self.username, self.password)
-            session.verify = False
+            # Authenticate the shared session (credentials may have changed)
+            self._session.auth = HTTPBasicAuth(self.username, self.password)
 
             # Configure Zeep
-            transport = Transport(session=session, timeout=10)
+            transport = Transport(session=self._session, cache=self._wsdl_cache, timeout=10)
             zeep_settings = Settings(strict=False, xml_huge_tree=True)
 
             # Create SOAP client
@@ -375,6 +667,8 @@ class RISClient:
             # Override endpoint
             service_endpoint = f"https://{self.cucm_host}:8443/perfmonservice2/services/PerfmonService"
             self.perfmon_client.service._binding_options["address"] = service_endpoint
+            self._perfmon_factory = self.perfmon_client.type_factory("ns0")
+            self._perfmon_host = self.cucm_host
 
             self.perfmon_connected = True
             logger.info("Successfully connected to CUCM PerfMon service")
@@ -385,139 +679,253 @@ class RISClient:
             logger.error(f"Failed to connect to CUCM PerfMon service: {e}")
             return False
 
-    def get_perfmon_metrics(self) -> dict:
+    def get_perfmon_metrics(self, counters: Sequence[str] = DEFAULT_PERFMON_COUNTERS) -> dict:
         """
-        Get PerfMon metrics (active calls) from all CUCM nodes.
-        Uses a single session for all nodes to avoid rate limiting.
+        Get PerfMon metrics from all CUCM nodes.
+        Uses a single session for all nodes to avoid rate limiting, kept open
+        across calls so a poll is one perfmonCollectSessionData request.
+
+        Args:
+            counters: Cisco CallManager counter names to collect for each node
 
         Returns:
             dict: {
-                'total_calls': int,
+                'total_calls': int,  # sum of CallsActive across nodes
                 'node_metrics': {
-                    'hostname': {'calls': int},
+                    'hostname': {'calls': int, '<counter>': value, ...},
                     ...
                 }
             }
         """
-        if not self.perfmon_connected:
-            if not self._connect_perfmon():
-                return {'total_calls': 0, 'node_metrics': {}}
-
-        # If we don't have CUCM nodes yet, return empty metrics
-        # Nodes will be populated from RIS query on first poll
+        key = (tuple(self.cucm_nodes), tuple(counters))
+
+        # Reuse recent metrics instead of repeating the PerfMon round-trips
+        if (
+            self._perfmon_cache is not None
+            and self._perfmon_cache_key == key
+            and time.monotonic() < self._perfmon_cache_expiry
+        ):
+            logger.debug("Using cached PerfMon metrics")
+            return self._perfmon_cache
+
+        # If we don't have CUCM nodes yet, return empty metrics without
+        # connecting; nodes will be populated from RIS query on first poll
         if not self.cucm_nodes:
             logger.debug("No CUCM nodes available yet for PerfMon metrics")
             return {'total_calls': 0, 'node_metrics': {}}
 
-        try:
-            type_factory = self.perfmon_client.type_factory("ns0")
+        # Returns straight away unless the client is missing or the CUCM
+        # host changed
+        if not self._connect_perfmon():
+            return {'total_calls': 0, 'node_metrics': {}}
 
-            # Open ONE session for all nodes
-            session_handle = self.perfmon_client.service.perfmonOpenSession()
-            logger.debug(f"Opened PerfMon session: {session_handle}")
+        try:
+            # Keep one session open across polls; only a new or changed node
+            # list needs a fresh session with its counters added
+            reused = (
+                self._perfmon_session_handle is not None
+                and self._perfmon_session_key == key
+            )
+            if not reused:
+                self._open_perfmon_session(counters)
 
             try:
-                # Create counters for ALL nodes (CallsActive only)
-                counter_list = []
-
-                for node_hostname in self.cucm_nodes:
-                    # CallsActive counter
-                    calls_counter_path = f"\\\\{node_hostname}\\Cisco CallManager\\CallsActive"
-                    calls_counter = type_factory.CounterType()
-                    calls_counter.Name = type_factory.CounterNameType(calls_counter_path)
-                    counter_list.append(calls_counter)
-
-                request_array = type_factory.RequestArrayOfCounterType()
-                request_array.Counter = counter_list
-
-                # Add counters
-                self.perfmon_client.service.perfmonAddCounter(
-                    SessionHandle=session_handle,
-                    ArrayOfCounter=request_array
-                )
-                logger.debug("Successfully added CallsActive counters")
-
                 # Collect data once for all nodes
                 result = self.perfmon_client.service.perfmonCollectSessionData(
-                    SessionHandle=session_handle
+                    SessionHandle=self._perfmon_session_handle
+                )
+            except Exception as e:
+                if not reused:
+                    raise
+                # The server may have expired the session; start over once
+                logger.debug("PerfMon collect failed on existing session, reopening: %s", e)
+                self._open_perfmon_session(counters)
+                result = self.perfmon_client.service.perfmonCollectSessionData(
+                    SessionHandle=self._perfmon_session_handle
                 )
 
-                # Parse result - handle Zeep objects
-                total_calls = 0
-                node_metrics = {}
+            # Parse result - handle Zeep objects
+            total_calls = 0
+            node_metrics = {}
 
-                if isinstance(result, list) and len(result) > 0:
-                    for counter_info in result:
-                        value = counter_info.Value if hasattr(counter_info, 'Value') else 0
+            if isinstance(result, list) and len(result) > 0:
+                for counter_info in result:
+                    value = counter_info.Value if hasattr(counter_info, 'Value') else 0
 
-                        # Extract node name from counter path
-                        if hasattr(counter_info, 'Name') and hasattr(counter_info.Name, '_value_1'):
-                            counter_name = counter_info.Name._value_1
+                    # Extract node name from counter path
+                    if hasattr(counter_info, 'Name') and hasattr(counter_info.Name, '_value_1'):
+                        counter_name = counter_info.Name._value_1
 
-                            # Parse counter name to get node hostname
-                            # Format: \\hostname\Cisco CallManager\CallsActive
-                            parts = counter_name.split('\\')
-                            if len(parts) >= 4:
-                                node_hostname = parts[2]
+                        # Parse counter name to get node hostname and counter
+                        # Format: \\hostname\Cisco CallManager\CallsActive
+                        parts = counter_name.split('\\')
+                        if len(parts) >= 4:
+                            node_hostname = parts[2]
+                            counter = parts[-1]
 
-                                # Initialize node metrics if not exists
-                                if node_hostname not in node_metrics:
-                                    node_metrics[node_hostname] = {'calls': 0}
+                            # Initialize node metrics if not exists
+                            if node_hostname not in node_metrics:
+                                node_metrics[node_hostname] = {'calls': 0}
 
+                            node_metrics[node_hostname][counter] = value
+                            if counter == "CallsActive":
                                 node_metrics[node_hostname]['calls'] = value
                                 total_calls += value
-                                logger.debug(f"Node {node_hostname}: {value} active calls")
-
-                logger.info(f"PerfMon metrics - Total calls: {total_calls}, Nodes: {len(node_metrics)}")
-                return {
-                    'total_calls': total_calls,
-                    'node_metrics': node_metrics
-                }
+                            logger.debug("Node %s: %s = %s", node_hostname, counter, value)
 
-            finally:
-                # Always close the session
-                try:
-                    self.perfmon_client.service.perfmonCloseSession(SessionHandle=session_handle)
-                    logger.debug("Closed PerfMon session")
-                except Exception as e:
-                    logger.warning(f"Error closing PerfMon session: {e}")
+            logger.info(f"PerfMon metrics - Total calls: {total_calls}, Nodes: {len(node_metrics)}")
+            metrics = {
+                'total_calls': total_calls,
+                'node_metrics': node_metrics
+            }
+            self._perfmon_cache = metrics
+            self._perfmon_cache_key = key
+            self._perfmon_cache_expiry = time.monotonic() + settings.perfmon_cache_ttl
+            return metrics
 
         except Exception as e:
+            # Drop the session so the next call starts a new one
+            self._perfmon_session_handle = None
             logger.error(f"Error getting PerfMon metrics: {e}")
             return {'total_calls': 0, 'node_metrics': {}}
 
-    def check_node_health_ping(self, node_hostnames: List[str]) -> Dict[str, bool]:
+    def _open_perfmon_session(self, counters: Sequence[str]):
         """
-        Check node health by pinging each hostname.
+        Open a PerfMon session with the given counters for the current nodes.
+
+        Every node x counter pair goes into a single perfmonAddCounter request;
+        PerfMon rate-limits per request, so never add them one at a time.
+        Any previously open session is closed first.
+
+        Args:
+            counters: Cisco CallManager counter names to add for each node
+        """
+        self._close_perfmon_session()
+
+        type_factory = self._perfmon_factory
+
+        # Open ONE session for all nodes
+        session_handle = self.perfmon_client.service.perfmonOpenSession()
+        logger.debug("Opened PerfMon session: %s", session_handle)
+
+        # Create every counter for ALL nodes
+        counter_list = []
+
+        for node_hostname in self.cucm_nodes:
+            for counter in counters:
+                counter_path = f"\\\\{node_hostname}\\Cisco CallManager\\{counter}"
+                perfmon_counter = type_factory.CounterType()
+                perfmon_counter.Name = type_factory.CounterNameType(counter_path)
+                counter_list.append(perfmon_counter)
+
+        request_array = type_factory.RequestArrayOfCounterType()
+        request_array.Counter = counter_list
+
+        # Add counters
+        try:
+            self.perfmon_client.service.perfmonAddCounter(
+                SessionHandle=session_handle,
+                ArrayOfCounter=request_array
+            )
+        except Exception:
+            self.perfmon_client.service.perfmonCloseSession(SessionHandle=session_handle)
+            raise
+        logger.debug("Successfully added %d PerfMon counters", len(counter_list))
+
+        self._perfmon_session_handle = session_handle
+        self._perfmon_session_key = (tuple(self.cucm_nodes), tuple(counters))
+
+    def _close_perfmon_session(self):
+        """Close the open PerfMon session, if any."""
+        session_handle = self._perfmon_session_handle
+        if session_handle is None:
+            return
+
+        self._perfmon_session_handle = None
+        try:
+            self.perfmon_client.service.perfmonCloseSession(SessionHandle=session_handle)
+            logger.debug("Closed PerfMon session")
+        except Exception as e:
+            logger.warning(f"Error closing PerfMon session: {e}")
+
+    def close(self):
+        """Release server-side resources (the open PerfMon session)."""
+        # Run on the PerfMon worker so it can't race an in-flight collection
+        self._perfmon_executor.submit(self._close_perfmon_session).result()
+
+    def check_node_health(self, node_hostnames: List[str]) -> Dict[str, bool]:
+        """
+        Check node health by probing each node's HTTPS port.
+
+        Nodes are probed in parallel, so a poll waits for the slowest node
+        rather than the sum of all of them.
 
         Args:
             node_hostnames: List of CUCM node hostnames to check
 
         Returns:
-            Dict mapping hostname -> bool (True if pingable, False otherwise)
+            Dict mapping hostname -> bool (True if reachable, False otherwise)
         """
-        node_health = {}
+        if not node_hostnames:
+            return {}
 
-        for hostname in node_hostnames:
-            try:
-                # Run ping command: -c 1 (1 packet), -W 2 (2 second timeout)
-                result = subprocess.run(
-                    ['ping', '-c', '1', '-W', '2', hostname],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    timeout=3
-                )
+        max_workers = min(len(node_hostnames), MAX_PROBE_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="probe") as executor:
+            results = executor.map(self._probe_tcp, node_hostnames)
+            return dict(zip(node_hostnames, results))
 
-                # Exit code 0 = successful ping
-                is_healthy = (result.returncode == 0)
-                node_health[hostname] = is_healthy
-                logger.debug(f"Ping check for {hostname}: {'Healthy' if is_healthy else 'Down'}")
+    def _resolve(self, host: str) -> str:
+        """
+        Resolve a hostname, reusing the result for DNS_CACHE_TTL seconds.
 
-            except subprocess.TimeoutExpired:
-                node_health[hostname] = False
-                logger.debug(f"Ping timeout for {hostname}: Down")
-            except Exception as e:
-                node_health[hostname] = False
-                logger.warning(f"Ping check failed for {hostname}: {e}")
+        If DNS fails when a cached address has expired, the stale address
+        is kept rather than failing the caller.
 
-        return node_health
+        Args:
+            host: Hostname (or IP address) to resolve
+
+        Returns:
+            str: IP address for the host
+
+        Raises:
+            OSError: If the host can't be resolved and nothing is cached
+        """
+        now = time.monotonic()
+        cached = self._dns_cache.get(host)
+        if cached is not None and now < cached[1]:
+            return cached[0]
+
+        try:
+            address = socket.getaddrinfo(host, None, type=socket.SOCK_STREAM)[0][4][0]
+        except OSError:
+            if cached is None:
+                raise
+            logger.warning(f"DNS lookup for {host} failed, using cached address {cached[0]}")
+            address = cached[0]
+
+        self._dns_cache[host] = (address, now + DNS_CACHE_TTL)
+        return address
+
+    def _probe_tcp(self, host: str, port: int = 8443, timeout: float = 2.0) -> bool:
+        """
+        Check that a node accepts TCP connections.
+
+        Connecting to the CUCM web/SOAP port checks the service we depend on
+        without forking a ping process or needing raw socket privileges.
+
+        Args:
+            host: CUCM node hostname to check
+            port: TCP port to connect to
+            timeout: Connect timeout in seconds
+
+        Returns:
+            bool: True if the connection succeeded, False otherwise
+        """
+        try:
+            with socket.create_connection((self._resolve(host), port), timeout=timeout):
+                pass
+            logger.debug("TCP probe for %s:%s: Healthy", host, port)
+            return True
+        except OSError as e:
+            logger.debug("TCP probe for %s:%s failed: %s", host, port, e)
+            return False
@@ -6,6 +6,7 @@ class CUCMMonitor {
         this.reconnectInterval = 3000;
         this.currentData = null;
         this.previousCallCount = 0;
+        this.decoder = new TextDecoder();
 
         this.init();
     }
@@ -24,6 +25,8 @@ class CUCMMonitor {
 
         try {
             this.ws = new WebSocket(wsUrl);
+            // Status updates arrive as binary frames of UTF-8 JSON
+            this.ws.binaryType = 'arraybuffer';
 
             this.ws.onopen = () => {
                 console.log('WebSocket connected');
@@ -33,8 +36,15 @@ class CUCMMonitor {
 
             this.ws.onmessage = (event) => {
                 try {
-                    const data = JSON.parse(event.data);
-                    this.handleUpdate(data);
+                    const text = typeof event.data === 'string'
+                        ? event.data
+                        : this.decoder.decode(event.data);
+                    const data = JSON.parse(text);
+                    if (data.type === 'delta') {
+                        this.applyDelta(data);
+                    } else {
+                        this.handleUpdate(data);
+                    }
                 } catch (error) {
                     console.error('Error parsing message:', error);
                 }
@@ -65,6 +75,22 @@ class CUCMMonitor {
         }, this.reconnectInterval);
     }
 
+    applyDelta(delta) {
+        // Deltas patch the last full snapshot; without one, request a resync
+        if (!this.currentData) {
+            this.ws.send('status');
+            return;
+        }
+
+        const devices = this.currentData.devices.slice();
+        for (const [index, device] of delta.changed_devices) {
+            devices[index] = device;
+        }
+
+        const { type, changed_devices, ...fields } = delta;
+        this.handleUpdate({ ...fields, devices });
+    }
+
     handleUpdate(data) {
         console.log('Received update:', data);
         this.currentData = data;
@@ -154,8 +180,9 @@ class CUCMMonitor {
             return;
         }
 
-        // Sort by device name
-        devices.sort((a, b) => a.name.localeCompare(b.name));
+        // Sort a copy by device name; currentData keeps the server's order,
+        // which delta indexes refer to
+        devices = [...devices].sort((a, b) => a.name.localeCompare(b.name));
 
         // Generate table rows
         tbody.innerHTML = devices.map(device => {